@@ -2,9 +2,14 @@
 from __future__ import annotations
 import streamlit as st
 import pandas as pd
+import atexit
+import os
+import queue
 import random
-import re
 import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -16,16 +21,28 @@ SMALL_LOGO_FILE = "VV_SmallLogo.png"
 SPLASH_IMAGE_PATH = ASSETS_DIR / SPLASH_IMAGE_FILE
 SMALL_LOGO_PATH = ASSETS_DIR / SMALL_LOGO_FILE
 
+# Columns returned by list_verses unless a caller projects fewer
+VERSE_COLUMNS = ("id", "ref", "text", "explanation", "translation", "created_at")
+VAULT_PAGE_SIZE = 25
+
+# Punctuation ignored when grading fill-in-the-blank answers
+_PUNCT_TABLE = str.maketrans("", "", ".,;:!?")
+
+
+@st.cache_data(show_spinner=False)
+def _cached_bytes(path_str: str, mtime_ns: int):
+    # mtime is part of the cache key so replacing an image picks up the new file
+    return Path(path_str).read_bytes()
+
 
 def _read_bytes_safe(path: Path):
     try:
-        return path.read_bytes() if path.exists() else None
+        return _cached_bytes(str(path), os.stat(path).st_mtime_ns)
     except Exception:
         return None
 
 
-def configure_page():
-    icon_bytes = _read_bytes_safe(SMALL_LOGO_PATH)
+def configure_page(icon_bytes):
     try:
         if icon_bytes is not None:
             st.set_page_config(page_title="VerseVault", page_icon=icon_bytes, layout="wide")
@@ -51,7 +68,28 @@ def show_splash():
         st.caption(f"(Splash image missing — expected: {SPLASH_IMAGE_PATH})")
 
 
-configure_page()
+def _parse_bulk_verses(raw: str):
+    """Parse pasted lines of `Ref | Text | Explanation | Translation` (last two optional).
+
+    Returns (rows, skipped). Lines missing a ref or text, or with more than four
+    fields (so a `|` inside the text can't silently cut it short), are skipped.
+    """
+    rows, skipped = [], 0
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        parts = [p.strip() for p in line.split("|")]
+        if not 2 <= len(parts) <= 4 or not parts[0] or not parts[1]:
+            skipped += 1
+            continue
+        parts += [""] * (4 - len(parts))
+        rows.append({"ref": parts[0], "text": parts[1], "explanation": parts[2], "translation": parts[3]})
+    return rows, skipped
+
+
+# The small logo is both the page icon and the sidebar image: read it once per run
+logo_bytes = _read_bytes_safe(SMALL_LOGO_PATH)
+configure_page(logo_bytes)
 
 @st.cache_resource(show_spinner=False)
 def get_storage():
@@ -78,37 +116,119 @@ class SupabaseStorage:
         self.verses = "vv_verses"
         self.future = "vv_future_verses"
 
-    def list_verses(self):
-        res = (self.client
-                 .table(self.verses)
-                 .select("*")
-                 .order("created_at", desc=True)
-                 .order("id", desc=True)
-                 .execute())
-        return pd.DataFrame(res.data or [])
+    def list_verses(self, cols=VERSE_COLUMNS, limit=None, offset=0):
+        return pd.DataFrame(self.list_verses_raw(cols, limit, offset), columns=list(cols))
+
+    def list_verses_raw(self, cols=VERSE_COLUMNS, limit=None, offset=0):
+        # Both sort keys match the (created_at desc, id desc) index in supabase/vv_indexes.sql
+        q = (self.client
+               .table(self.verses)
+               .select(",".join(cols))
+               .order("created_at", desc=True)
+               .order("id", desc=True))
+        if limit is not None:
+            q = q.range(offset, offset + limit - 1)
+        res = q.execute()
+        return res.data or []
+
+    def get_verse(self, id_):
+        res = self.client.table(self.verses).select("id,ref,text").eq("id", id_).limit(1).execute()
+        return res.data[0] if res.data else None
+
+    def count_verses(self):
+        res = self.client.table(self.verses).select("id", count="exact", head=True).execute()
+        return res.count or 0
 
     def add_verse(self, ref, text, explanation, translation):
-        self.client.table(self.verses).insert({"ref": ref, "text": text, "explanation": explanation, "translation": translation}).execute()
+        self.add_verses_bulk([{"ref": ref, "text": text, "explanation": explanation, "translation": translation}])
+
+    def add_verses_bulk(self, rows):
+        # One HTTP round-trip for every row; skip echoing the inserted rows back
+        if rows:
+            self.client.table(self.verses).insert(list(rows), returning="minimal").execute()
 
     def update_verse(self, id_, ref, text, explanation, translation):
         self.client.table(self.verses).update({"ref": ref, "text": text, "explanation": explanation, "translation": translation}).eq("id", id_).execute()
 
-    def list_future(self):
-        res = self.client.table(self.future).select("*").order("created_at", desc=True).execute()
-        return pd.DataFrame(res.data or [])
+    def list_future_raw(self):
+        res = (self.client
+                 .table(self.future)
+                 .select("*")
+                 .order("created_at", desc=True)
+                 .order("id", desc=True)
+                 .execute())
+        return res.data or []
 
     def add_future(self, ref):
-        self.client.table(self.future).insert({"ref": ref}).execute()
+        self.add_future_bulk([ref])
+
+    def add_future_bulk(self, refs):
+        if refs:
+            self.client.table(self.future).insert([{"ref": r} for r in refs], returning="minimal").execute()
 
     def remove_future(self, id_):
         self.client.table(self.future).delete().eq("id", id_).execute()
 
 
 class SQLiteStorage:
-    def __init__(self):
+    # Writes between `pragma optimize` runs on the long-lived writer connection
+    OPTIMIZE_EVERY = 500
+
+    def __init__(self, path="vv_local.db"):
         self.backend = "sqlite"
-        self.conn = sqlite3.connect("vv_local.db", check_same_thread=False)
+        self.path = path
+        # One writer shared by every script thread (serialized by a lock) plus a pool of
+        # read-only connections, so WAL readers never wait on it. Streamlit runs each
+        # rerun on a fresh thread, so readers are pooled rather than kept per thread.
+        self.conn = self._connect()
+        self._write_lock = threading.Lock()
+        self._idle_readers = queue.LifoQueue()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+        self._writes_since_optimize = 0
         self._init()
+        # Only a weak reference: "Reconnect" drops this instance from cache_resource, and it
+        # must be free to be collected (closing its connections) rather than pinned by atexit.
+        atexit.register(SQLiteStorage._close_ref, weakref.ref(self))
+
+    @staticmethod
+    def _close_ref(ref):
+        storage = ref()
+        if storage is not None:
+            storage.close()
+
+    def _connect(self, readonly=False):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        # WAL + relaxed sync: fewer fsyncs per commit and readers don't block on writes.
+        # In-memory databases can't use WAL (or mmap), so only tune the cache there.
+        if self.path != ":memory:":
+            conn.execute("pragma journal_mode=WAL")
+            conn.execute("pragma synchronous=NORMAL")
+            conn.execute("pragma mmap_size=134217728")
+        conn.execute("pragma temp_store=MEMORY")
+        conn.execute("pragma cache_size=-20000")
+        conn.execute("pragma busy_timeout=5000")
+        if readonly:
+            conn.execute("pragma query_only=1")
+        return conn
+
+    @contextmanager
+    def _reader(self):
+        # Each :memory: connection is its own database, so reads must share the writer there
+        if self.path == ":memory:":
+            with self._write_lock:
+                yield self.conn
+            return
+        try:
+            conn = self._idle_readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect(readonly=True)
+            with self._readers_lock:
+                self._readers.append(conn)
+        try:
+            yield conn
+        finally:
+            self._idle_readers.put(conn)
 
     def _init(self):
         cur = self.conn.cursor()
@@ -129,37 +249,186 @@ class SQLiteStorage:
                 created_at text default (datetime('now'))
             )
         """)
+        # created_at is ISO text from datetime('now'), so it sorts correctly as a plain string
+        cur.execute("create index if not exists idx_verses_created on vv_verses(created_at desc, id desc)")
+        cur.execute("create index if not exists idx_future_created on vv_future_verses(created_at desc, id desc)")
         self.conn.commit()
+        # Long-lived connection: refresh planner stats on open; _note_writes and close()
+        # run it again every OPTIMIZE_EVERY writes and at shutdown.
+        cur.execute("pragma optimize=0x10002")
+
+    def close(self):
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        try:
+            with self._write_lock:
+                self.conn.execute("pragma optimize")
+                self.conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _note_writes(self, n):
+        # Caller holds the write lock and has committed
+        self._writes_since_optimize += n
+        if self._writes_since_optimize >= self.OPTIMIZE_EVERY:
+            self._writes_since_optimize = 0
+            self.conn.execute("pragma optimize")
+
+    def _write(self, sql, params=()):
+        with self._write_lock:
+            self.conn.execute(sql, params)
+            self.conn.commit()
+            self._note_writes(1)
 
     def add_verse(self, ref, text, explanation, translation):
-        self.conn.execute("insert into vv_verses(ref, text, explanation, translation) values(?,?,?,?)", (ref, text, explanation, translation))
-        self.conn.commit()
+        self._write("insert into vv_verses(ref, text, explanation, translation) values(?,?,?,?)", (ref, text, explanation, translation))
+
+    def add_verses_bulk(self, rows):
+        # One transaction (and one fsync) for the whole import; `with conn` commits or rolls back
+        params = [(r["ref"], r["text"], r.get("explanation"), r.get("translation")) for r in rows]
+        with self._write_lock:
+            with self.conn:
+                self.conn.executemany("insert into vv_verses(ref, text, explanation, translation) values(?,?,?,?)", params)
+            self._note_writes(len(params))
 
     def update_verse(self, id_, ref, text, explanation, translation):
-        self.conn.execute("update vv_verses set ref=?, text=?, explanation=?, translation=? where id= ?", (ref, text, explanation, translation, id_))
-        self.conn.commit()
+        self._write("update vv_verses set ref=?, text=?, explanation=?, translation=? where id= ?", (ref, text, explanation, translation, id_))
+
+    def list_verses(self, cols=VERSE_COLUMNS, limit=None, offset=0):
+        return pd.DataFrame(self.list_verses_raw(cols, limit, offset), columns=list(cols))
+
+    def list_verses_raw(self, cols=VERSE_COLUMNS, limit=None, offset=0):
+        # limit -1 means "no limit" to SQLite; offset still needs a limit clause
+        sql = f"select {', '.join(cols)} from vv_verses order by created_at desc, id desc limit ? offset ?"
+        return self._fetch_dicts(sql, (-1 if limit is None else limit, offset))
 
-    def list_verses(self):
-        return pd.read_sql_query("select * from vv_verses order by datetime(created_at) desc, id desc", self.conn)
+    def _fetch_dicts(self, sql, params=()):
+        with self._reader() as conn:
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+            return [dict(r) for r in cur.execute(sql, params).fetchall()]
+
+    def get_verse(self, id_):
+        with self._reader() as conn:
+            row = conn.execute("select id, ref, text from vv_verses where id=? limit 1", (id_,)).fetchone()
+        return dict(zip(("id", "ref", "text"), row)) if row else None
+
+    def count_verses(self):
+        with self._reader() as conn:
+            return conn.execute("select count(*) from vv_verses").fetchone()[0]
 
     def add_future(self, ref):
-        self.conn.execute("insert into vv_future_verses(ref) values(?)", (ref,))
-        self.conn.commit()
+        self._write("insert into vv_future_verses(ref) values(?)", (ref,))
 
-    def list_future(self):
-        return pd.read_sql_query("select * from vv_future_verses order by datetime(created_at) desc, id desc", self.conn)
+    def add_future_bulk(self, refs):
+        with self._write_lock:
+            with self.conn:
+                self.conn.executemany("insert into vv_future_verses(ref) values(?)", [(r,) for r in refs])
+            self._note_writes(len(refs))
+
+    def list_future_raw(self):
+        return self._fetch_dicts("select * from vv_future_verses order by created_at desc, id desc")
 
     def remove_future(self, id_):
-        self.conn.execute("delete from vv_future_verses where id=?", (id_,))
-        self.conn.commit()
+        self._write("delete from vv_future_verses where id=?", (id_,))
 
 
 storage = get_storage()
 
+
+# ---------- CACHED READS ----------
+# Reruns read through st.cache_data; every write bumps a version counter so the
+# next read misses the cache. The ttl picks up Supabase rows edited elsewhere.
+@st.cache_resource(show_spinner=False)
+def _data_versions():
+    # Shared by all sessions so one session's write invalidates everyone's reads
+    return {"verses": 0, "future": 0}
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def _cached_list_verses(backend: str, version: int, cols: tuple, limit, offset: int):
+    return storage.list_verses(cols, limit, offset)
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def _cached_list_verses_raw(backend: str, version: int, cols: tuple, limit, offset: int):
+    return storage.list_verses_raw(cols, limit, offset)
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def _cached_get_verse(backend: str, version: int, id_: int):
+    return storage.get_verse(id_)
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def _cached_count_verses(backend: str, version: int):
+    return storage.count_verses()
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def _cached_list_future_raw(backend: str, version: int):
+    return storage.list_future_raw()
+
+
+def list_verses(cols=VERSE_COLUMNS, limit=None, offset=0):
+    return _cached_list_verses(storage.backend, _data_versions()["verses"], tuple(cols), limit, offset)
+
+
+def list_verses_raw(cols=VERSE_COLUMNS, limit=None, offset=0):
+    # Plain dicts for callers that just iterate rows; skips DataFrame construction
+    return _cached_list_verses_raw(storage.backend, _data_versions()["verses"], tuple(cols), limit, offset)
+
+
+def get_verse(id_):
+    return _cached_get_verse(storage.backend, _data_versions()["verses"], int(id_))
+
+
+def count_verses():
+    return _cached_count_verses(storage.backend, _data_versions()["verses"])
+
+
+def list_future_raw():
+    return _cached_list_future_raw(storage.backend, _data_versions()["future"])
+
+
+def add_verse(ref, text, explanation, translation):
+    storage.add_verse(ref, text, explanation, translation)
+    _data_versions()["verses"] += 1
+
+
+def update_verse(id_, ref, text, explanation, translation):
+    storage.update_verse(id_, ref, text, explanation, translation)
+    _data_versions()["verses"] += 1
+
+
+def add_verses_bulk(rows):
+    storage.add_verses_bulk(rows)
+    _data_versions()["verses"] += 1
+
+
+def add_future(ref):
+    storage.add_future(ref)
+    _data_versions()["future"] += 1
+
+
+def add_future_bulk(refs):
+    storage.add_future_bulk(refs)
+    _data_versions()["future"] += 1
+
+
+def remove_future(id_):
+    storage.remove_future(id_)
+    _data_versions()["future"] += 1
+
+
 # ---------- SIDEBAR ----------
 with st.sidebar:
-    # Sidebar logo with safe-bytes loader
-    logo_bytes = _read_bytes_safe(SMALL_LOGO_PATH)
+    # Sidebar logo (loaded once above for the page icon)
     if logo_bytes is not None:
         st.image(logo_bytes, use_container_width=True)
     else:
@@ -173,6 +442,7 @@ with st.sidebar:
 (Supabase if secrets provided; otherwise local SQLite.)""")
     if st.button("Reconnect Supabase", use_container_width=True):
         st.cache_resource.clear()
+        st.cache_data.clear()
         st.rerun()
 
 # ---------- HOME ----------
@@ -192,182 +462,236 @@ vt, qt, ft, mt = st.tabs(["Vault", "Quiz", "Future Verses", "Manage Vault"])
 # ----- VAULT -----
 with vt:
     st.subheader("Your Verse Vault")
-    df = storage.list_verses()
-    if df.empty:
+    total = count_verses()
+    if total == 0:
         st.info("No verses yet. Add one in Manage Vault.")
     else:
-        for _, r in df.iterrows():
-            with st.expander(r["ref"]):
-                st.write(r["text"])
-                if r.get("explanation"): st.write(r["explanation"])
+        # Only fetch the columns and rows this page actually renders
+        pages = -(-total // VAULT_PAGE_SIZE)
+        page = 1
+        if pages > 1:
+            # No max_value: it is part of the widget identity, so a growing page count
+            # would reset the input to page 1. Clamp the stored value before the widget
+            # is created instead, so the input always shows the page being rendered.
+            # (The default lives in session_state too, so value= isn't passed alongside it.)
+            if st.session_state.setdefault("vault_page", 1) > pages:
+                st.session_state.vault_page = pages
+            page = int(st.number_input("Page", min_value=1, step=1, key="vault_page"))
+        df = list_verses(cols=("ref", "text", "explanation"), limit=VAULT_PAGE_SIZE, offset=(page - 1) * VAULT_PAGE_SIZE)
+        # Decide once per page whether any explanation needs rendering, then specialize the loop
+        any_expl = "explanation" in df.columns and df["explanation"].fillna("").astype(bool).any()
+        if any_expl:
+            for r in df.itertuples(index=False):
+                with st.expander(r.ref):
+                    st.write(r.text)
+                    if r.explanation: st.write(r.explanation)
+        else:
+            for r in df.itertuples(index=False):
+                with st.expander(r.ref):
+                    st.write(r.text)
+        if pages > 1:
+            st.caption(f"Page {page} of {pages} · {total} verses")
 
 # ----- QUIZ -----
+# Each quiz tab is a fragment: submitting an answer or pressing Next reruns just that
+# tab instead of the whole script (sidebar, Vault page, Manage forms, ...).
+# Per-verse quiz state lives in one dict per (tab, verse) so Next can drop it in one pop.
+def _resync_quiz():
+    # The cached id list still holds a verse that is gone from the database (deleted
+    # from another client): drop the cached reads and rebuild the orderings.
+    _data_versions()["verses"] += 1
+    st.session_state.pop("verses_fp", None)
+    st.rerun()
+
+
+# Next runs as an on_click callback: it advances before the (fragment or full) rerun that
+# follows the click, so no st.rerun is needed and either kind of rerun works.
+def _mem_next(cur_id):
+    st.session_state.mem_pos = (st.session_state.mem_pos + 1) % len(st.session_state.mem_ids)
+    # reset state for current verse
+    st.session_state.setdefault("quiz", {}).pop(("mem", cur_id), None)
+    st.session_state.pop(f"mem_ta_{cur_id}", None)
+
+
+def _fib_next(cur_id, num_blanks):
+    st.session_state.fib_pos = (st.session_state.fib_pos + 1) % len(st.session_state.fib_ids)
+    # regenerate blanks next time this verse appears & clear cached results
+    for i in range(1, num_blanks + 1):
+        st.session_state.pop(f"fib_ans_{cur_id}_{i}", None)
+    st.session_state.setdefault("quiz", {}).pop(("fib", cur_id), None)
+
+
+@st.fragment
+def memorization_quiz():
+    quiz_state = st.session_state.setdefault("quiz", {})
+
+    cur_id = st.session_state.mem_ids[st.session_state.mem_pos]
+    cur = get_verse(cur_id)
+    if cur is None:
+        _resync_quiz()
+    st.write(f"**Verse:** {cur['ref']}")
+
+    # Persist results visibility across reruns
+    qs = quiz_state.setdefault(("mem", cur_id), {})
+
+    # Stable keys: clear_on_submit empties the box, so keys needn't rotate per question
+    with st.form(f"mem_form_{cur_id}", clear_on_submit=True):
+        mem_text = st.text_area("Type out the verse from memory:", key=f"mem_ta_{cur_id}")
+        mem_submitted = st.form_submit_button("Submit (Memorization)")
+
+    if mem_submitted:
+        qs["show"] = True
+        qs["text"] = mem_text
+
+    if qs.get("show", False):
+        st.write("### Your Answer:")
+        st.info(qs.get("text", ""))
+        st.write("### Correct Verse:")
+        st.success(cur['text'])
+        st.button("Next (Memorization)", key=f"mem_next_{cur_id}", on_click=_mem_next, args=(cur_id,))
+
+
+@st.fragment
+def fill_in_the_blank_quiz():
+    quiz_state = st.session_state.setdefault("quiz", {})
+
+    cur_id = st.session_state.fib_ids[st.session_state.fib_pos]
+    cur = get_verse(cur_id)
+    if cur is None:
+        _resync_quiz()
+
+    # Tokenize and pick blanks once per verse so they don't change while typing;
+    # reruns reuse the cached layout until Next.
+    qs = quiz_state.setdefault(("fib", cur_id), {})
+    # Only a hash of the text is kept, to notice edits without storing the verse itself
+    text_hash = hash(cur["text"])
+    if qs.get("text_hash") != text_hash:
+        words = cur["text"].split()
+        n = len(words)
+        if n <= 15:
+            num_blanks = 3
+        elif n <= 30:
+            num_blanks = 5
+        else:
+            num_blanks = 7
+        choose = min(num_blanks, n)
+        blank_indices = sorted(random.sample(range(n), choose))
+
+        # Build prompt and answer map (strip punctuation from answers)
+        blank_map = {}
+        prompt_words = words[:]
+        for i, idx in enumerate(blank_indices, start=1):
+            clean = words[idx].translate(_PUNCT_TABLE)
+            blank_map[f"[{i}]"] = clean
+            prompt_words[idx] = f"[{i}]"
+        # A new (or edited) verse text invalidates any earlier results too
+        qs.clear()
+        qs.update(text_hash=text_hash, prompt=" ".join(prompt_words), blank_map=blank_map)
+    blank_map = qs["blank_map"]
+
+    st.write(f"**Verse:** {cur['ref']}")
+    st.markdown(qs["prompt"])
+
+    with st.form(f"fib_form_{cur_id}", clear_on_submit=True):
+        answers = {}
+        for i in range(1, len(blank_map) + 1):
+            answers[i] = st.text_input(f"Answer for [{i}]", key=f"fib_ans_{cur_id}_{i}")
+        fib_submitted = st.form_submit_button("Submit (Fill in the Blank)")
+
+    if fib_submitted:
+        # Cache results so they persist across reruns until Next
+        results = []
+        for tag, correct in blank_map.items():
+            i = int(tag.strip("[]"))
+            user_answer = answers.get(i, "")
+            ok = user_answer.lower().strip().translate(_PUNCT_TABLE) == correct.lower()
+            results.append((tag, user_answer, correct, ok))
+        qs["results"] = results
+        qs["show"] = True
+
+    if qs.get("show", False):
+        st.write("### Results:")
+        for tag, user_answer, correct, ok in qs.get("results", []):
+            if ok:
+                st.success(f"{tag}: {user_answer} ✅")
+            else:
+                st.error(f"{tag}: {user_answer} ❌ (Correct: {correct})")
+        st.button("Next (Fill in the Blank)", key=f"fib_next_{cur_id}", on_click=_fib_next, args=(cur_id, len(blank_map)))
+
+
 with qt:
     st.subheader("Quiz")
-    df_all = storage.list_verses()
-    if df_all.empty:
+    # The quiz only needs the id order up front; each tab then fetches its one verse
+    id_rows = list_verses_raw(cols=("id",))
+    if not id_rows:
         st.info("Add at least one verse to use the quiz.")
     else:
         mem_tab, fill_tab = st.tabs(["Memorization (Newest → Oldest)", "Fill in the Blank (Random)"])
 
-        # Stable widget-key epoch to avoid duplicate keys across states
-        if "quiz_epoch" not in st.session_state:
-            st.session_state.quiz_epoch = 0
-
-        # Prepare verse id list (deterministic newest→oldest)
-        ids_desc = df_all["id"].tolist()
+        # Only rebuild the quiz orderings when the verse set changes. (count, newest id) is a
+        # cheap fingerprint that catches additions; deletions (from another client) show up
+        # as get_verse returning None, which _resync_quiz handles by forcing a rebuild.
+        fp = (len(id_rows), int(id_rows[0]["id"]))
+        if st.session_state.get("verses_fp") != fp:
+            st.session_state.verses_fp = fp
+            # Prepare verse id list (deterministic newest→oldest)
+            ids_desc = [int(r["id"]) for r in id_rows]
+
+            # --- Memorization: deterministic order, keep position on the current verse ---
+            current_id = None
+            if st.session_state.get("mem_ids"):
+                # clamp mem_pos
+                st.session_state.mem_pos = min(st.session_state.mem_pos, len(st.session_state.mem_ids)-1)
+                current_id = st.session_state.mem_ids[st.session_state.mem_pos]
+            st.session_state.mem_ids = ids_desc
+            # move pointer to same verse if still present
+            if current_id in ids_desc:
+                st.session_state.mem_pos = ids_desc.index(current_id)
+            else:
+                st.session_state.mem_pos = 0
 
-        # --- Memorization: deterministic order, preserve position across reruns ---
-        if "mem_ids" not in st.session_state:
-            st.session_state.mem_ids = ids_desc[:]
-            st.session_state.mem_pos = 0
-        else:
-            # Only rebuild if the SET of ids changed (added/removed). Keep position by current id.
-            if set(st.session_state.mem_ids) != set(ids_desc):
-                current_id = None
-                if st.session_state.mem_ids:
-                    # clamp mem_pos
-                    st.session_state.mem_pos = min(st.session_state.mem_pos, len(st.session_state.mem_ids)-1)
-                    current_id = st.session_state.mem_ids[st.session_state.mem_pos]
-                st.session_state.mem_ids = ids_desc[:]
-                # move pointer to same verse if still present
-                if current_id in st.session_state.mem_ids:
-                    st.session_state.mem_pos = st.session_state.mem_ids.index(current_id)
-                else:
-                    st.session_state.mem_pos = 0
-
-        # --- Fill-in-the-blank: keep a fixed shuffle for the session; rebuild only when set changes ---
-        if "fib_ids" not in st.session_state:
-            fib = ids_desc[:]
-            random.shuffle(fib)
-            st.session_state.fib_ids = fib
+            # --- Fill-in-the-blank: fixed shuffle for the session, redone only when the set changes ---
+            st.session_state.fib_ids = random.sample(ids_desc, len(ids_desc))
             st.session_state.fib_pos = 0
-        else:
-            if set(st.session_state.fib_ids) != set(ids_desc):
-                fib = ids_desc[:]
-                random.shuffle(fib)
-                st.session_state.fib_ids = fib
-                st.session_state.fib_pos = 0
-
-        # Helper to get row by id
-        def _get_row_by_id(vid):
-            return df_all[df_all["id"] == vid].iloc[0]
 
         # -------------------- MEMORIZATION --------------------
         with mem_tab:
-            cur_id = st.session_state.mem_ids[st.session_state.mem_pos]
-            cur = _get_row_by_id(cur_id)
-            st.write(f"**Verse:** {cur['ref']}")
-
-            epoch = st.session_state.quiz_epoch
-            # Persist results visibility across reruns
-            mem_flag_key = f"mem_show_{cur_id}"
-
-            with st.form(f"mem_form_{cur_id}_{epoch}"):
-                mem_text = st.text_area("Type out the verse from memory:", key=f"mem_ta_{cur_id}_{epoch}")
-                mem_submitted = st.form_submit_button("Submit (Memorization)")
-
-            if mem_submitted:
-                st.session_state[mem_flag_key] = True
-                st.session_state[f"mem_text_{cur_id}"] = mem_text
-
-            if st.session_state.get(mem_flag_key, False):
-                st.write("### Your Answer:")
-                st.info(st.session_state.get(f"mem_text_{cur_id}", ""))
-                st.write("### Correct Verse:")
-                st.success(cur['text'])
-                if st.button("Next (Memorization)", key=f"mem_next_{cur_id}_{epoch}"):
-                    st.session_state.mem_pos = (st.session_state.mem_pos + 1) % len(st.session_state.mem_ids)
-                    # reset state for current verse and bump epoch so widget keys rotate
-                    st.session_state[mem_flag_key] = False
-                    st.session_state.pop(f"mem_text_{cur_id}", None)
-                    st.session_state.quiz_epoch += 1
-                    st.rerun()
+            memorization_quiz()
 
         # ----------------- FILL IN THE BLANK -----------------
         with fill_tab:
-            cur_id = st.session_state.fib_ids[st.session_state.fib_pos]
-            cur = _get_row_by_id(cur_id)
-
-            words = cur["text"].split()
-            n = len(words)
-            if n <= 15:
-                num_blanks = 3
-            elif n <= 30:
-                num_blanks = 5
-            else:
-                num_blanks = 7
-
-            # Keep per-verse blanks so they don't change while typing
-            if "fb_blanks_per_id" not in st.session_state:
-                st.session_state.fb_blanks_per_id = {}
-            if cur_id not in st.session_state.fb_blanks_per_id:
-                choose = min(num_blanks, n)
-                st.session_state.fb_blanks_per_id[cur_id] = sorted(random.sample(range(n), choose))
-            blank_indices = st.session_state.fb_blanks_per_id[cur_id]
-
-            # Build prompt and answer map (strip punctuation from answers)
-            blank_map = {}
-            prompt_words = words[:]
-            for i, idx in enumerate(blank_indices, start=1):
-                clean = re.sub(r"[.,;:!?]", "", words[idx])
-                blank_map[f"[{i}]"] = clean
-                prompt_words[idx] = f"[{i}]"
-
-            st.write(f"**Verse:** {cur['ref']}")
-            st.markdown(" ".join(prompt_words))
-
-            epoch = st.session_state.quiz_epoch
-            fib_flag_key = f"fib_show_{cur_id}"
-
-            with st.form(f"fib_form_{cur_id}_{epoch}"):
-                answers = {}
-                for i in range(1, len(blank_indices) + 1):
-                    answers[i] = st.text_input(f"Answer for [{i}]", key=f"fib_ans_{cur_id}_{i}_{epoch}")
-                fib_submitted = st.form_submit_button("Submit (Fill in the Blank)")
-
-            if fib_submitted:
-                # Cache results so they persist across reruns until Next
-                results = []
-                for tag, correct in blank_map.items():
-                    i = int(tag.strip("[]"))
-                    user_answer = answers.get(i, "")
-                    ok = re.sub(r"[.,;:!?]", "", user_answer.lower().strip()) == correct.lower()
-                    results.append((tag, user_answer, correct, ok))
-                st.session_state[f"fib_results_{cur_id}"] = results
-                st.session_state[fib_flag_key] = True
-
-            if st.session_state.get(fib_flag_key, False):
-                st.write("### Results:")
-                for tag, user_answer, correct, ok in st.session_state.get(f"fib_results_{cur_id}", []):
-                    if ok:
-                        st.success(f"{tag}: {user_answer} ✅")
-                    else:
-                        st.error(f"{tag}: {user_answer} ❌ (Correct: {correct})")
-                if st.button("Next (Fill in the Blank)", key=f"fib_next_{cur_id}_{epoch}"):
-                    st.session_state.fib_pos = (st.session_state.fib_pos + 1) % len(st.session_state.fib_ids)
-                    # regenerate blanks next time this verse appears & clear cached results
-                    st.session_state.fb_blanks_per_id.pop(cur_id, None)
-                    st.session_state.pop(f"fib_results_{cur_id}", None)
-                    st.session_state[fib_flag_key] = False
-                    st.session_state.quiz_epoch += 1
-                    st.rerun()
+            fill_in_the_blank_quiz()
 
 # ----- FUTURE VERSES -----
 with ft:
     st.subheader("Future Verses")
     new = st.text_input("Add verse reference")
     if st.button("Add Future Verse") and new.strip():
-        storage.add_future(new)
+        add_future(new)
         st.success(f"Added {new}")
         st.rerun()
-    df2 = storage.list_future()
-    if not df2.empty:
-        for _, row in df2.iterrows():
+    with st.expander("Add several at once"):
+        # Show the outcome of a bulk add that just triggered a rerun
+        added = st.session_state.pop("future_bulk_result", 0)
+        if added:
+            st.success(f"Added {added} future verse(s)")
+        # clear_on_submit empties the box, so a second click can't add the same refs again
+        with st.form("future_bulk_form", clear_on_submit=True):
+            many = st.text_area("One verse reference per line", key="future_bulk")
+            future_bulk_submitted = st.form_submit_button("Add Future Verses")
+        if future_bulk_submitted:
+            refs = [line.strip() for line in many.splitlines() if line.strip()]
+            if refs:
+                add_future_bulk(refs)
+                st.session_state.future_bulk_result = len(refs)
+                st.rerun()
+    future_rows = list_future_raw()
+    if future_rows:
+        for row in future_rows:
             cols = st.columns([5, 1])
             cols[0].markdown(f"- **{row['ref']}**")
             if cols[1].button("Remove", key=f"remove_{row['id']}"):
-                storage.remove_future(row['id'])
+                remove_future(row['id'])
                 st.rerun()
     else:
         st.info("No future verses yet. Add one above.")
@@ -375,7 +699,7 @@ with ft:
 # ----- MANAGE VAULT -----
 with mt:
     st.subheader("Manage Vault")
-    add_tab, edit_tab = st.tabs(["Add Verse", "Edit Verse"])
+    add_tab, bulk_tab, edit_tab = st.tabs(["Add Verse", "Bulk Import", "Edit Verse"])
 
     with add_tab:
         ref = st.text_input("Verse Reference")
@@ -383,16 +707,38 @@ with mt:
         exp = st.text_area("Explanation")
         trans = st.text_input("Translation")
         if st.button("Add Verse") and ref and text:
-            storage.add_verse(ref, text, exp, trans)
+            add_verse(ref, text, exp, trans)
             st.success(f"Added {ref} to your vault!")
 
+    with bulk_tab:
+        st.caption("One verse per line: `Reference | Verse Text | Explanation | Translation` (explanation and translation optional).")
+        # Show the outcome of an import that just triggered a rerun
+        imported, skipped = st.session_state.pop("bulk_result", (0, 0))
+        if imported:
+            st.success(f"Imported {imported} verse(s) into your vault!")
+        if skipped:
+            st.warning(f"Skipped {skipped} line(s): each needs a reference and verse text, and at most four `|`-separated fields.")
+        # clear_on_submit empties the box, so a second click can't import the same rows again
+        with st.form("bulk_import_form", clear_on_submit=True):
+            raw = st.text_area("Paste verses", key="bulk_verses")
+            bulk_submitted = st.form_submit_button("Import Verses")
+        if bulk_submitted:
+            rows, skipped = _parse_bulk_verses(raw)
+            if rows:
+                add_verses_bulk(rows)
+            st.session_state.bulk_result = (len(rows), skipped)
+            # Rerun so the Vault and Quiz tabs pick up the new verses in this same click
+            st.rerun()
+
     with edit_tab:
-        df_edit = storage.list_verses()
-        if df_edit.empty:
+        edit_list = list_verses_raw()
+        if not edit_list:
             st.info("No verses to edit yet.")
         else:
-            selected = st.selectbox("Select a verse to edit", df_edit["ref"].tolist())
-            verse_row = df_edit[df_edit["ref"] == selected].iloc[0]
+            # Key the selectbox by id so picking a verse is a dict lookup, not a DataFrame scan
+            edit_rows = {int(r["id"]): r for r in edit_list}
+            selected_id = st.selectbox("Select a verse to edit", list(edit_rows), format_func=lambda i: edit_rows[i]["ref"])
+            verse_row = edit_rows[selected_id]
 
             new_ref = st.text_input("Edit Reference", verse_row["ref"])
             new_text = st.text_area("Edit Verse Text", verse_row["text"])
@@ -400,6 +746,6 @@ with mt:
             new_trans = st.text_input("Edit Translation", verse_row.get("translation", ""))
 
             if st.button("Save Changes"):
-                storage.update_verse(verse_row["id"], new_ref, new_text, new_exp, new_trans)
+                update_verse(verse_row["id"], new_ref, new_text, new_exp, new_trans)
                 st.success(f"Updated {new_ref} successfully!")
                 st.rerun()
@@ -0,0 +1,7 @@
+-- Composite indexes matching the app's `order by created_at desc, id desc`
+-- so PostgREST list queries stream rows in index order instead of sorting.
+--
+-- Run once in the Supabase SQL editor against the project that already holds
+-- the vv_verses / vv_future_verses tables (and their access policies).
+create index if not exists vv_verses_created_id on public.vv_verses (created_at desc, id desc);
+create index if not exists vv_future_verses_created_id on public.vv_future_verses (created_at desc, id desc);